@@ -1,10 +1,14 @@
 import os
 import argparse
+from itertools import islice
 from . import APP_NAME, APP_DESCRIPTION, CONFIG_DIR, CACHE_DIR
 from .app import App
 from .can import MagicCANBus, MessageTable
 from .parse import CANOpenParser, load_eds_file
 
+# Maximum number of messages taken from the bus between two draw cycles
+MESSAGE_BATCH_SIZE = 256
+
 
 def init_dirs():
     os.makedirs(CONFIG_DIR, exist_ok=True)
@@ -48,16 +52,20 @@ def main():
         with MagicCANBus(args.interfaces, no_block=args.no_block) as bus, \
              App(mt) as app:
             while True:
-                # Bus updates
-                for message in bus:
-                    if message is not None:
-                        mt += message
+                # Bus updates, take any queued messages up to a full batch so
+                #   that a flooded bus cannot starve input handling or drawing
+                received = 0
+                for message in islice(bus, MESSAGE_BATCH_SIZE):
+                    mt += message
+                    received += 1
 
-                # User Input updates
-                app._handle_keyboard_input()
+                # User Input updates, while the bus is idle this sleeps until
+                #   either a key is pressed or the next frame is due
+                app._handle_keyboard_input(block=(received == 0))
 
-                # Draw update
-                app.draw(bus.statuses)
+                # Draw update, at most once per frame interval
+                if(app.should_draw):
+                    app.draw(bus.statuses)
     except KeyboardInterrupt:
         print('Goodbye!')
 
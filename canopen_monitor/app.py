@@ -1,14 +1,18 @@
 from __future__ import annotations
 import curses
+import time
 import datetime as dt
 from enum import Enum
 from . import APP_NAME, APP_VERSION, APP_LICENSE, APP_AUTHOR, APP_DESCRIPTION, APP_URL
 from .can import MessageTable, MessageType
 from .ui import MessagePane, PopupWindow
 
+# Upper limit on how many frames are drawn per second
+FRAME_RATE = 30
+
 
 def pad_hex(value: int) -> str:
-    return f'0x{hex(value).upper()[2:].rjust(3, "0")}'
+    return f'0x{value:03X}'
 
 
 class KeyMap(Enum):
@@ -29,6 +33,12 @@ class KeyMap(Enum):
 
 class App:
     """The User Interface
+
+    .. note::
+
+        The App, its panes and the message table are only ever touched from
+        the main thread. The bus listener threads hand frames over solely
+        through the `MagicCANBus` message queue, so drawing needs no locking.
     """
 
     def __init__(self: App, message_table: MessageTable):
@@ -36,18 +46,27 @@ class App:
         self.selected_pane_pos = 0
         self.selected_pane = None
 
+        # Draw throttling, a redraw can be forced regardless of the frame rate
+        self._frame_interval = 1 / FRAME_RATE
+        self._last_draw = 0.0
+        self._redraw = True
+
     def __enter__(self: App):
         # Monitor setup, take a snapshot of the terminal state
         self.screen = curses.initscr()  # Initialize standard out
         self.screen.scrollok(True)      # Enable window scroll
         self.screen.keypad(True)        # Enable special key input
-        self.screen.nodelay(True)       # Disable user-input blocking
         curses.curs_set(False)          # Disable the cursor
         self.__init_color_pairs()       # Enable colors and create pairs
 
+        # Interface styles for the header, one for each of the UP/DOWN states
+        self.__iface_up_style = curses.color_pair(1)
+        self.__iface_down_style = curses.color_pair(3)
+
         # Don't initialize any grids, sub-panes, or windows until standard io
         #   screen has been initialized
         height, width = self.screen.getmaxyx()
+        self.__height = height
         height -= 1
         self.info_win = PopupWindow(self.screen,
                                     header=f'{APP_NAME.title()}'
@@ -97,6 +116,10 @@ class App:
                                      x=0,
                                      name='Miscellaneous',
                                      message_table=self.table)
+        self.__panes = [self.hb_pane,
+                        self.misc_pane,
+                        self.info_win,
+                        self.hotkeys_win]
         self.__select_pane(self.hb_pane, 0)
         return self
 
@@ -108,14 +131,20 @@ class App:
         curses.resetty()        # Restore the terminal state
         curses.endwin()         # Destroy the virtual screen
 
-    def _handle_keyboard_input(self: App) -> None:
+    def _handle_keyboard_input(self: App, block: bool = False) -> None:
         """This is only a temporary implementation
 
         .. deprecated::
 
             Soon to be removed
+
+        :param block: Wait for user input until the next frame is due, instead
+            of returning immediately if there is none
+        :type block: bool
         """
-        # Grab user input
+        # Grab user input, curses waits on stdin so the thread sleeps until
+        #   either a key is pressed or the timeout passes
+        self.screen.timeout(self.__time_to_next_frame if block else 0)
         input = self.screen.getch()
         curses.flushinp()
 
@@ -132,9 +161,13 @@ class App:
         elif(input == curses.KEY_RIGHT):
             self.selected_pane.scroll_right(rate=4)
         elif(input == curses.KEY_RESIZE):
+            self.__height = self.screen.getmaxyx()[0]
+            for pane in self.__panes:
+                pane._reset_parent_dimensions()
             self.hb_pane._reset_scroll_positions()
             self.misc_pane._reset_scroll_positions()
-            self.screen.clear()
+            self.screen.erase()
+            self._redraw = True
         elif(input == 567):  # Ctrl + Up
             self.__select_pane(self.hb_pane, 0)
         elif(input == 526):  # Ctrl + Down
@@ -142,13 +175,15 @@ class App:
         elif(input == curses.KEY_F1):
             if(self.hotkeys_win.enabled):
                 self.hotkeys_win.toggle()
-                self.hotkeys_win.clear()
+                self.hotkeys_win.erase()
             self.info_win.toggle()
+            self._redraw = True
         elif(input == curses.KEY_F2):
             if(self.info_win.enabled):
                 self.info_win.toggle()
-                self.info_win.clear()
+                self.info_win.erase()
             self.hotkeys_win.toggle()
+            self._redraw = True
 
     def __init_color_pairs(self: App) -> None:
         curses.start_color()
@@ -177,19 +212,44 @@ class App:
 
         # Draw the interfaces
         for iface in ifaces:
-            color = curses.color_pair(1) if iface[1] else curses.color_pair(3)
+            color = self.__iface_up_style if iface[1] \
+                else self.__iface_down_style
             sl = len(iface[0])
             self.screen.addstr(0, pos, iface[0], color)
             pos += sl + 1
 
     def __draw__footer(self: App) -> None:
-        height, width = self.screen.getmaxyx()
         footer = '<F1>: Info, <F2>: Hotkeys'
-        self.screen.addstr(height - 1, 1, footer)
+        self.screen.addstr(self.__height - 1, 1, footer)
+
+    @property
+    def __time_to_next_frame(self: App) -> int:
+        if(self._redraw):
+            return 0
+        remaining = self._last_draw + self._frame_interval - time.monotonic()
+        return max(0, int(remaining * 1000))
+
+    @property
+    def should_draw(self: App) -> bool:
+        """Whether a new frame is due, either because a redraw was forced or
+        because enough time has passed since the last frame was drawn
+
+        :return: An indication that `draw()` should be called
+        :rtype: bool
+        """
+        return self._redraw \
+            or (time.monotonic() - self._last_draw) >= self._frame_interval
 
     def draw(self: App, ifaces: [tuple]):
+        self._last_draw = time.monotonic()
+        self._redraw = False
         window_active = self.info_win.enabled or self.hotkeys_win.enabled
         self.__draw_header(ifaces)  # Draw header info
+        self.__draw__footer()  # Draw footer info
+
+        # Stage the standard screen before the panes so that the panes are
+        #   layered on top of it in the virtual screen
+        self.screen.noutrefresh()
 
         # Draw panes
         if(not window_active):
@@ -200,7 +260,9 @@ class App:
         self.info_win.draw()
         self.hotkeys_win.draw()
 
-        self.__draw__footer()  # Draw footer info
+        # Write the whole frame to the terminal in a single update
+        curses.doupdate()
 
     def refresh(self: App):
-        self.screen.refresh()
+        self.screen.noutrefresh()
+        curses.doupdate()
@@ -121,7 +121,6 @@ class Interface(SocketCanDev):
                            data=list(frame.data),
                            frame_type=frame.frame_type,
                            interface=self.name,
-                           timestamp=dt.datetime.now(),
                            extended=frame.is_extended_id)
         except OSError:
             return None
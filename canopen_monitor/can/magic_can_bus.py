@@ -1,9 +1,12 @@
 from __future__ import annotations
 from .interface import Interface
 from .message import Message
+import time
 import queue
 import threading as t
 
+_STATUS_INTERVAL = 1.0
+
 
 class MagicCANBus:
     """This is a macro-manager for multiple CAN interfaces
@@ -14,23 +17,34 @@ class MagicCANBus:
     """
 
     def __init__(self: MagicCANBus, if_names: [str], no_block: bool = False):
-        self.interfaces = list(map(lambda x: Interface(x), if_names))
+        self.interfaces = [Interface(x) for x in if_names]
         self.no_block = no_block
         self.keep_alive = t.Event()
         self.keep_alive.set()
         self.message_queue = queue.SimpleQueue()
         self.threads = None
+        self.__statuses = None
+        self.__statuses_expiry = 0.0
 
     @property
     def statuses(self: MagicCANBus) -> [tuple]:
         """This property is simply an aggregate of all of the interfaces and
         whether or not they both exist and are in the `UP` state
 
+        .. note::
+
+            Querying the interface states is relatively expensive, so the
+            statuses are only refreshed once every `_STATUS_INTERVAL` seconds
+
         :return: a list of tuples containing the interface names and a bool
             indication an `UP/DOWN` status
         :rtype: [tuple]
         """
-        return list(map(lambda x: (x.name, x.is_up), self.interfaces))
+        now = time.monotonic()
+        if(self.__statuses is None or now >= self.__statuses_expiry):
+            self.__statuses = [(x.name, x.is_up) for x in self.interfaces]
+            self.__statuses_expiry = now + _STATUS_INTERVAL
+        return self.__statuses
 
     def start_handler(self: MagicCANBus, iface: Interface) -> t.Thread:
         """This is a wrapper for starting a single interface listener thread
@@ -89,8 +103,7 @@ class MagicCANBus:
         iface.stop()
 
     def __enter__(self: MagicCANBus) -> MagicCANBus:
-        self.threads = list(map(lambda x: self.start_handler(x),
-                                self.interfaces))
+        self.threads = [self.start_handler(x) for x in self.interfaces]
         return self
 
     def __exit__(self: MagicCANBus,
@@ -112,14 +125,15 @@ class MagicCANBus:
         return self
 
     def __next__(self: MagicCANBus) -> Message:
-        if(self.message_queue.empty()):
+        try:
+            return self.message_queue.get_nowait()
+        except queue.Empty:
             raise StopIteration
-        return self.message_queue.get(block=True)
 
     def __str__(self: MagicCANBus) -> str:
         # Subtract 1 since the parent thread should not be counted
         alive_threads = t.active_count() - 1
-        if_list = ', '.join(list(map(lambda x: str(x), self.interfaces)))
+        if_list = ', '.join(str(x) for x in self.interfaces)
         return f"Magic Can Bus: {if_list}," \
                f" pending messages: {self.message_queue.qsize()}" \
                f" threads: {alive_threads}," \
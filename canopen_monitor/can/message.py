@@ -1,4 +1,5 @@
 from __future__ import annotations
+import time
 import datetime as dt
 from enum import Enum
 from pyvit.can import Frame
@@ -97,15 +98,23 @@ class MessageType(Enum):
         :return: The message type (range) the COB ID fits into
         :rtype: MessageType
         """
-        for t in list(MessageType):
-            if(cob_id >= t.value[0] and cob_id <= t.value[1]):
-                return t
+        if(0 <= cob_id < len(_COB_ID_TYPES)):
+            return _COB_ID_TYPES[cob_id]
         return MessageType['UKNOWN']
 
     def __str__(self) -> str:
         return self.name
 
 
+# Lookup table of every standard (11-bit) COB ID to its message type, this is
+#   built once so that classifying a message does not scan every type range.
+#   The first type whose range contains the COB ID wins.
+_COB_ID_TYPES = tuple(next((t for t in MessageType
+                            if(t.value[0] <= cob_id <= t.value[1])),
+                           MessageType['UKNOWN'])
+                      for cob_id in range(0x800))
+
+
 class MessageState(Enum):
     """This enumeration describes all possible states of a CAN Message
 
@@ -139,11 +148,35 @@ class Message(Frame):
     frame, while adding age and state attributes as well.
     """
 
-    def __init__(self: Message, arb_id: int, **kwargs):
+    def __init__(self: Message,
+                 arb_id: int,
+                 timestamp_ns: int = None,
+                 **kwargs):
+        # The receive time is kept as an integer, and is only converted to a
+        #   datetime when it's displayed
+        self.timestamp_ns = time.time_ns() if timestamp_ns is None \
+            else timestamp_ns
         super().__init__(arb_id, **kwargs)
-        self.node_name = MessageType.cob_to_node(self.type, self.arb_id)
+
+        # Classify the message once, since the type and supertype are read for
+        #   every message on every draw cycle
+        self._type = MessageType.cob_id_to_type(self.arb_id)
+        self._supertype = self._type.supertype
+        self.node_name = MessageType.cob_to_node(self._type, self.arb_id)
         self.message = self.data
 
+        self.__reset_deadlines()
+
+    def __reset_deadlines(self: Message) -> None:
+        # Monotonic deadlines of the message state, so that checking the state
+        #   is a single comparison against the clock. They're brought forward
+        #   by however long ago the message was received, in case the receive
+        #   time was given rather than stamped just now
+        age = (time.time_ns() - self.timestamp_ns) / 1e9
+        received = time.monotonic() - age
+        self._stale_at = received + STALE_TIME.total_seconds()
+        self._dead_at = received + DEAD_TIME.total_seconds()
+
     @property
     def age(self: Message) -> dt.timedelta:
         """The age of the Message since it was received from the CAN bus
@@ -151,7 +184,23 @@ class Message(Frame):
         :return: Age of the message
         :rtype: datetime.timedelta
         """
-        return dt.datetime.now() - self.timestamp
+        return dt.timedelta(microseconds=(time.time_ns() - self.timestamp_ns)
+                            // 1000)
+
+    @property
+    def timestamp(self: Message) -> dt.datetime:
+        """The time the Message was received from the CAN bus
+
+        :return: Receive time of the message
+        :rtype: datetime.datetime
+        """
+        return dt.datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+    @timestamp.setter
+    def timestamp(self: Message, value: dt.datetime) -> None:
+        if(value is not None):
+            self.timestamp_ns = int(value.timestamp() * 1e9)
+            self.__reset_deadlines()
 
     @property
     def state(self: Message) -> MessageState:
@@ -160,9 +209,10 @@ class Message(Frame):
         :return: State of the message
         :rtype: MessageState
         """
-        if(self.age >= DEAD_TIME):
+        now = time.monotonic()
+        if(now >= self._dead_at):
             return MessageState['DEAD']
-        elif(self.age >= STALE_TIME):
+        elif(now >= self._stale_at):
             return MessageState['STALE']
         else:
             return MessageState['ALIVE']
@@ -174,7 +224,7 @@ class Message(Frame):
         :return: CAN Message Type
         :rtype: MessageType
         """
-        return MessageType.cob_id_to_type(self.arb_id)
+        return self._type
 
     @property
     def supertype(self: Message) -> MessageType:
@@ -183,7 +233,7 @@ class Message(Frame):
         :return: CAN Message Super-Type
         :rtype: MessageType
         """
-        return self.type.supertype
+        return self._supertype
 
     @property
     def node_id(self: Message) -> int:
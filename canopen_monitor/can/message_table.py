@@ -7,9 +7,16 @@ class MessageTable:
         self.parser = parser
         self.table = {}
 
+        # The COB IDs matching each set of types filtered on, in table order.
+        #   The type of a message is decided by its COB ID, so these only
+        #   change when a message with a new COB ID is added
+        self.__filtered = {}
+
     def __add__(self: MessageTable, message: Message) -> MessageTable:
         if(self.parser is not None):
             message.message = self.parser.parse(message)
+        if(message.arb_id not in self.table):
+            self.__filtered.clear()
         self.table[message.arb_id] = message
         return self
 
@@ -20,10 +27,14 @@ class MessageTable:
                types: MessageType,
                start: int = 0,
                end: int = None) -> [Message]:
+        key = tuple(types)
+        arb_ids = self.__filtered.get(key)
+        if(arb_ids is None):
+            arb_ids = [arb_id for arb_id, message in self.table.items()
+                       if message.type in types or message.supertype in types]
+            self.__filtered[key] = arb_ids
         end = len(self.table) if end is None else end
-        messages = list(filter(lambda x: x.type in types
-                        or x.supertype in types, self.table.values()))
-        return messages[start:end]
+        return [self.table[arb_id] for arb_id in arb_ids[start:end]]
 
     def __contains__(self: MessageTable, node_id: int) -> bool:
         return node_id in self.table
@@ -8,6 +8,18 @@ from .sdo import SDOParser
 from .utilities import FailedValidationError
 
 
+# Stateless parsers for each message type, SDO messages are not included since
+#   they are parsed by the stateful SDO parser of a `CANOpenParser`
+_PARSERS = {
+    MessageType.SYNC: SYNCParser.parse,
+    MessageType.EMER: EMCYParser.parse,
+    MessageType.HEARTBEAT: HBParser.parse,
+    MessageType.TIME: TIMEParser.parse,
+    **{t: PDOParser.parse for t in MessageType
+       if t.supertype == MessageType.PDO},
+}
+
+
 class CANOpenParser:
     def __init__(self, eds_configs: dict):
         self.sdo_parser = SDOParser()
@@ -18,28 +30,16 @@ class CANOpenParser:
         eds_config = self.eds_configs.get(hex(node_id)) \
             if node_id is not None else None
 
-        if (message.type == MessageType.SYNC):
-            parse = SYNCParser.parse
-        elif (message.type == MessageType.EMER):
-            parse = EMCYParser.parse
-        elif (message.supertype == MessageType.PDO):
-            parse = PDOParser.parse
-        elif (message.supertype == MessageType.SDO):
+        mtype = message.type
+        if (mtype.supertype == MessageType.SDO):
             if self.sdo_parser.is_complete:
                 self.sdo_parser = SDOParser()
             parse = self.sdo_parser.parse
-        elif (message.type == MessageType.HEARTBEAT):
-            parse = HBParser.parse
-        elif (message.type == MessageType.TIME):
-            parse = TIMEParser.parse
         else:
-            parse = None
+            parse = _PARSERS.get(mtype)
 
         try:
             parsed_message = parse(message.arb_id, message.data, eds_config)
         except (FailedValidationError, TypeError):
-            parsed_message = ' '.join(list(map(lambda x: hex(x)[2:]
-                                               .upper()
-                                               .rjust(2, '0'),
-                                               message.data)))
+            parsed_message = ' '.join(f'{x:02X}' for x in message.data)
         return parsed_message
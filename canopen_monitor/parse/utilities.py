@@ -108,8 +108,7 @@ def decode(defined_type: str, data: List[int]) -> str:
         data = array.array('B', data).tobytes()
         result = data.decode('utf-8')
     elif defined_type in (OCTET_STRING, DOMAIN):
-        data = list(map(lambda x: hex(x)[2:].rjust(2, '0'), data))
-        result = '0x' + ''.join(data)
+        result = '0x' + ''.join(f'{x:02x}' for x in data)
     elif defined_type == UNICODE_STRING:
         data = array.array('B', data).tobytes()
         result = data.decode('utf-16-be')
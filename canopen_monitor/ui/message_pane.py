@@ -1,6 +1,7 @@
 from __future__ import annotations
 from .pane import Pane
 from ..can import Message, MessageType, MessageTable
+from operator import attrgetter
 import curses
 
 
@@ -148,32 +149,26 @@ class MessagePane(Pane):
             self.__top += leftover
             self.__top = max if(self.__top > max) else self.__top
 
-    def __draw_header(self: Pane) -> None:
+    def __draw_header(self: Pane, title: str) -> None:
         """Draw the table header at the top of the Pane
 
         This uses the `cols` dictionary to determine what to write
+
+        :param title: The pane title to write over the top border
+        :type title: str
         """
-        self.add_line(0,
-                      2,
-                      f'{self._name}:'
-                      f' ({len(self.table.filter(self.types))} messages)',
-                      highlight=self.selected)
+        self.add_line(0, 2, title, highlight=self.selected)
 
-        pos = 1
-        for name, data in self.cols.items():
-            self.add_line(1,
-                          pos,
-                          f'{name}:'.ljust(data[1] + self.__col_sep, ' '),
-                          highlight=True,
-                          color=curses.color_pair(4))
-            pos += data[1] + self.__col_sep
+        self.add_line(1,
+                      1,
+                      ''.join(f'{name}:'.ljust(data[1] + self.__col_sep, ' ')
+                              for name, data in self.cols.items()),
+                      highlight=True,
+                      color=self.__header_style)
 
     def draw(self: MessagePane) -> None:
         """Draw all records from the MessageTable to the Pane
         """
-        super().draw()
-        self.resize(self.v_height, self.v_width)
-
         # Get the messages to be displayed based on scroll positioning,
         #   and adjust column widths accordingly
         draw_messages = self.table.filter(self.types,
@@ -181,19 +176,33 @@ class MessagePane(Pane):
                                           self.__top + self.d_height - 3)
         self.__check_col_widths(draw_messages)
 
-        # Draw the header and messages
-        self.__draw_header()
+        # Size the pad to fit the widest line up front, so that writing the
+        #   lines never needs to resize it
+        title = f'{self._name}: ({len(self.table.filter(self.types))}' \
+                ' messages)'
+        width = max(2 + len(title),
+                    1 + sum(data[1] + self.__col_sep
+                            for data in self.cols.values()))
+        self.resize(self.v_height, max(self.v_width, width))
+        super().draw()
+
+        # Resolve each column's attribute getter, formatter, and padded width
+        #   once per frame rather than once per cell
+        columns = [(attrgetter(data[0]),
+                    data[2] if (len(data) == 3) else str,
+                    data[1] + self.__col_sep)
+                   for data in self.cols.values()]
+
+        # Draw the header and messages, each row is composed into a single line
+        #   so that it's written to the pad at once
+        self.__draw_header(title)
         for i, message in enumerate(draw_messages):
-            pos = 1
-            for name, data in self.cols.items():
-                attr = getattr(message, data[0])
-                callable = data[2] if (len(data) == 3) else str
-                self.add_line(2 + i,
-                              pos,
-                              callable(attr).ljust(data[1] + self.__col_sep,
-                                                   ' '),
-                              highlight=((self.cursor == i) and self.selected))
-                pos += data[1] + self.__col_sep
+            row = ''.join(to_str(get(message)).ljust(col_width, ' ')
+                          for get, to_str, col_width in columns)
+            self.add_line(2 + i,
+                          1,
+                          row,
+                          highlight=((self.cursor == i) and self.selected))
 
         # Refresh the Pane and end the draw cycle
         super().refresh()
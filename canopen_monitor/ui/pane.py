@@ -52,16 +52,26 @@ class Pane(ABC):
         self._pad.scrollok(True)
 
         # Set the draw dimensions
-        self.__reset_draw_dimensions()
+        self._reset_parent_dimensions()
 
         # Pane style options and state details
         self.border = border
         self.selected = False
         self._style = curses.color_pair(color_pair)
-        self.needs_refresh = False
+
+        # Line style attributes, resolved once instead of on every add_line()
+        self._style_bold = curses.A_BOLD
+        self._style_underline = curses.A_UNDERLINE
+        self._style_rev = curses.A_REVERSE
+
         self.scroll_position_y = 0
         self.scroll_position_x = 0
 
+        # Lines already written to the pad, keyed by their position, so that
+        #   unchanged lines are not re-written on every draw cycle
+        self._prev_lines = {}
+        self._border_drawn = False
+
     @property
     def scroll_limit_y(self: Pane) -> int:
         return 0
@@ -81,14 +91,14 @@ class Pane(ABC):
 
         child class should also set _scroll_limit_x and _scroll_limit_y here
         """
-        if self.needs_refresh:
-            self.refresh()
-
         self.parent.attron(self._style)
         self._pad.attron(self._style)
 
-        if(self.border):
+        # The border stays in the pad until it's cleared or resized, so it only
+        #   needs to be drawn again after either of those
+        if(self.border and not self._border_drawn):
             self._pad.box()
+            self._border_drawn = True
 
     def resize(self: Pane, height: int, width: int) -> None:
         """Resize the virtual pad and change internal variables to reflect that
@@ -99,15 +109,24 @@ class Pane(ABC):
         :param width: New virtual width
         :type width: int
         """
+        if((height, width) != (self.v_height, self.v_width)):
+            self._prev_lines = {}
+            self._border_drawn = False
         self.v_height = height
         self.v_width = width
         self.__reset_draw_dimensions()
         self._pad.resize(self.v_height, self.v_width)
 
+    def _reset_parent_dimensions(self: Pane) -> None:
+        """Re-read the dimensions of the parent window, this should be called
+        whenever the parent is resized, such as on a terminal resize event
+        """
+        self.__p_height, self.__p_width = self.parent.getmaxyx()
+        self.__reset_draw_dimensions()
+
     def __reset_draw_dimensions(self: Pane) -> None:
-        p_height, p_width = self.parent.getmaxyx()
-        self.d_height = min(self.v_height, p_height - 1)
-        self.d_width = min(self.v_width, p_width - 1)
+        self.d_height = min(self.v_height, self.__p_height - 1)
+        self.d_width = min(self.v_width, self.__p_width - 1)
 
     def clear(self: Pane) -> None:
         """Clear all contents of pad and parent window
@@ -120,8 +139,21 @@ class Pane(ABC):
         """
         self._pad.clear()
         self.parent.clear()
+        self._prev_lines = {}
+        self._border_drawn = False
         # self.refresh()
 
+    def erase(self: Pane) -> None:
+        """Erase all contents of pad and parent window
+
+        Unlike `clear()`, this does not make curses clear the entire terminal
+        on the next update, the erased areas are simply overwritten with blanks
+        """
+        self._pad.erase()
+        self.parent.erase()
+        self._prev_lines = {}
+        self._border_drawn = False
+
     def clear_line(self: Pane, y: int, style: any = None) -> None:
         """Clears a single line of the Pane
 
@@ -140,14 +172,19 @@ class Pane(ABC):
 
     def refresh(self: Pane) -> None:
         """Refresh the pane based on configured draw dimensions
+
+        .. note::
+
+            This only stages the pane in the virtual screen, the terminal is
+            not updated until `curses.doupdate()` is called, so that all panes
+            are written to the terminal at once
         """
-        self._pad.refresh(self.scroll_position_y,
-                          self.scroll_position_x,
-                          self.y,
-                          self.x,
-                          self.y + self.d_height,
-                          self.x + self.d_width)
-        self.needs_refresh = False
+        self._pad.noutrefresh(self.scroll_position_y,
+                              self.scroll_position_x,
+                              self.y,
+                              self.x,
+                              self.y + self.d_height,
+                              self.x + self.d_width)
 
     def scroll_up(self: Pane, rate: int = 1) -> bool:
         """Scroll pad upwards
@@ -241,8 +278,12 @@ class Pane(ABC):
                  underline: bool = False,
                  highlight: bool = False,
                  color: any = None) -> None:
-        """Adds a line of text to the Pane and if needed, it handles the
-        process of resizing the embedded pad
+        """Adds a line of text to the Pane
+
+        .. note::
+
+            The embedded pad is not resized to fit the line, it should already
+            be sized to fit all of the Pane's content using `resize()`
 
         :param y: Line's row position
         :type y: int
@@ -265,23 +306,16 @@ class Pane(ABC):
         # Set the color option to the pane default if none was specified
         line_style = color or self._style
 
-        # Widen pad when necessary
-        new_width = len(line) + x
-        if(new_width > self.v_width):
-            self.resize(self.v_height, new_width)
-
-        # Heighten the pad when necessary
-        if(y > self.v_height):
-            self.resize(y + 1, self.v_width)
-
         # Add style options
         if(bold):
-            line_style |= curses.A_BOLD
+            line_style |= self._style_bold
         if(highlight):
-            line_style |= curses.A_REVERSE
+            line_style |= self._style_rev
         if(underline):
-            line_style |= curses.A_UNDERLINE
+            line_style |= self._style_underline
 
-        # Add the line
-        if(y < self.d_height):
+        # Add the line, unless the exact same line is already there
+        if(y < self.d_height
+                and self._prev_lines.get((y, x)) != (line, line_style)):
             self._pad.addstr(y, x, line, line_style)
+            self._prev_lines[(y, x)] = (line, line_style)
@@ -30,9 +30,8 @@ class PopupWindow(Pane):
         # UI dimensions
         p_height, p_width = self.parent.getmaxyx()
         self.v_height = (len(self.content)) + 2
-        width = len(self.header) + 2
-        if(len(self.content) > 0):
-            width = max(width, max(list(map(lambda x: len(x), self.content))))
+        width = max(len(self.header) + 2,
+                    max(map(len, self.content), default=0))
         self.v_width = width + 4
         self.y = int(((p_height + self.v_height) / 2) - self.v_height)
         self.x = int(((p_width + self.v_width) / 2) - self.v_width)
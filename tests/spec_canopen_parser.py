@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import mock_open, patch
+
+from canopen_monitor.can import Message
+from canopen_monitor.parse import eds, CANOpenParser
+from tests import TEST_EDS
+
+
+class CANOpenParser_Spec(unittest.TestCase):
+    """Tests for the CANOpen parser"""
+
+    def setUp(self):
+        with patch('builtins.open', mock_open(read_data=TEST_EDS)) as m:
+            eds_config = eds.load_eds_file("star_tracker_OD.eds")
+        self.parser = CANOpenParser({hex(0x0): eds_config})
+
+    def test_sync(self):
+        """Given a SYNC message
+        When parsing the message
+        Then the SYNC counter should be returned
+        """
+        message = Message(0x001, data=[0x81])
+        self.assertEqual('SYNC - 129', self.parser.parse(message))
+
+    def test_pdo(self):
+        """Given a message of one of the PDO types
+        When parsing the message
+        Then the PDO should be decoded using the EDS of the sending node
+        """
+        message = Message(0x180, data=[0x3F, 0x80, 0x00, 0x00])
+        self.assertEqual('Orientation orientation - 1.0',
+                         self.parser.parse(message))
+
+    def test_sdo(self):
+        """Given an SDO download request followed by its response
+        When parsing both messages
+        Then both should be decoded by the same SDO transfer, and the next SDO
+        message should start a new transfer
+        """
+        request = Message(0x600,
+                          data=[0x27, 0x10, 0x18, 0x00, 0x0A, 0x00, 0x00,
+                                0x00])
+        response = Message(0x580,
+                           data=[0x60, 0x10, 0x18, 0x00, 0x00, 0x00, 0x00,
+                                 0x00])
+        self.assertEqual('Downloaded - Identity unsigned8: 10',
+                         self.parser.parse(request))
+        self.assertEqual('Downloaded - Identity unsigned8: 10',
+                         self.parser.parse(response))
+
+        transfer = self.parser.sdo_parser
+        self.parser.parse(request)
+        self.assertIsNot(transfer, self.parser.sdo_parser)
+
+    def test_heartbeat(self):
+        """Given a heartbeat message
+        When parsing the message
+        Then the state of the node should be returned
+        """
+        message = Message(0x701, data=[0x04])
+        self.assertEqual('Stopped', self.parser.parse(message))
+
+    def test_unknown(self):
+        """Given a message with a COB ID outside of every CANOpen type
+        When parsing the message
+        Then the raw data should be returned as a hex dump
+        """
+        message = Message(0x6A0, data=[0x01, 0xAB])
+        self.assertEqual('01 AB', self.parser.parse(message))
+
+    def test_no_parser(self):
+        """Given an NMT message, which has no parser
+        When parsing the message
+        Then the raw data should be returned as a hex dump
+        """
+        message = Message(0x000, data=[0x01, 0x0A])
+        self.assertEqual('01 0A', self.parser.parse(message))
+
+    def test_invalid(self):
+        """Given a message of a known type with an invalid payload
+        When parsing the message
+        Then the raw data should be returned as a hex dump
+        """
+        message = Message(0x701, data=[0xFF])
+        self.assertEqual('FF', self.parser.parse(message))
@@ -0,0 +1,105 @@
+import time
+import unittest
+import datetime as dt
+from canopen_monitor.can import Message, MessageState, MessageType
+from canopen_monitor.can.message import STALE_TIME, DEAD_TIME
+from unittest.mock import patch
+
+
+class MessageType_Spec(unittest.TestCase):
+    """Tests for the Message Type"""
+
+    def test_cob_id_to_type(self):
+        """Given a COB ID inside of a message type range
+        When converting the COB ID to a message type
+        Then the type of the range the COB ID falls into should be returned
+        """
+        self.assertEqual(MessageType.cob_id_to_type(0x0), MessageType.NMT)
+        self.assertEqual(MessageType.cob_id_to_type(0x81), MessageType.EMER)
+        self.assertEqual(MessageType.cob_id_to_type(0x100), MessageType.TIME)
+        self.assertEqual(MessageType.cob_id_to_type(0x1A1),
+                         MessageType.PDO1_TX)
+        self.assertEqual(MessageType.cob_id_to_type(0x621),
+                         MessageType.SDO_RX)
+        self.assertEqual(MessageType.cob_id_to_type(0x7FF),
+                         MessageType.HEARTBEAT)
+
+    def test_cob_id_to_type_unknown(self):
+        """Given a COB ID outside of every message type range
+        When converting the COB ID to a message type
+        Then the unknown type should be returned
+        """
+        self.assertEqual(MessageType.cob_id_to_type(0x6A0),
+                         MessageType.UKNOWN)
+        self.assertEqual(MessageType.cob_id_to_type(0x800),
+                         MessageType.UKNOWN)
+        self.assertEqual(MessageType.cob_id_to_type(-0x1),
+                         MessageType.UKNOWN)
+
+
+class Message_Spec(unittest.TestCase):
+    """Tests for the Message"""
+
+    @patch('time.monotonic')
+    def setUp(self, monotonic):
+        monotonic.return_value = 0.0
+        self.message = Message(0x721, data=[0x05])
+
+    @patch('time.monotonic')
+    def test_state_alive(self, monotonic):
+        """Given a message that was just received
+        When checking the state of the message
+        Then the state should be alive
+        """
+        monotonic.return_value = 1.0
+        self.assertEqual(self.message.state, MessageState.ALIVE)
+
+    @patch('time.monotonic')
+    def test_state_stale(self, monotonic):
+        """Given a message that was received longer ago than the stale time
+        When checking the state of the message
+        Then the state should be stale
+        """
+        monotonic.return_value = STALE_TIME.total_seconds()
+        self.assertEqual(self.message.state, MessageState.STALE)
+
+    @patch('time.monotonic')
+    def test_state_dead(self, monotonic):
+        """Given a message that was received longer ago than the dead time
+        When checking the state of the message
+        Then the state should be dead
+        """
+        monotonic.return_value = DEAD_TIME.total_seconds()
+        self.assertEqual(self.message.state, MessageState.DEAD)
+
+    def test_timestamp(self):
+        """Given a message received at a known time
+        When reading the timestamp of the message
+        Then the receive time should be returned as a datetime
+        """
+        message = Message(0x721, data=[0x05], timestamp_ns=1_000_000_000)
+        self.assertEqual(message.timestamp,
+                         dt.datetime.fromtimestamp(1))
+
+    def test_state_given_timestamp_ns(self):
+        """Given a message created with a receive time older than the stale
+        time
+        When checking the state of the message
+        Then the state should be stale
+        """
+        received = time.time_ns() - int(STALE_TIME.total_seconds() * 1e9) \
+            - 1_000_000_000
+        message = Message(0x721, data=[0x05], timestamp_ns=received)
+        self.assertEqual(message.state, MessageState.STALE)
+
+    def test_state_given_timestamp(self):
+        """Given a message created with a receive time datetime older than the
+        dead time
+        When checking the age and state of the message
+        Then the age should match the receive time and the state should be
+        dead
+        """
+        received = dt.datetime.now() - dt.timedelta(minutes=10)
+        message = Message(0x721, data=[0x05], timestamp=received)
+        self.assertGreaterEqual(message.age, dt.timedelta(minutes=10))
+        self.assertEqual(message.state, MessageState.DEAD)
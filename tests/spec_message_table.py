@@ -0,0 +1,46 @@
+import unittest
+from canopen_monitor.can import Message, MessageTable, MessageType
+
+
+class MessageTable_Spec(unittest.TestCase):
+    """Tests for the Message Table"""
+
+    def setUp(self):
+        self.table = MessageTable()
+        self.table += Message(0x701, data=[0x05])
+        self.table += Message(0x181, data=[0x01])
+        self.table += Message(0x702, data=[0x05])
+
+    def test_filter(self):
+        """Given a table with messages of different types
+        When filtering the table by a type
+        Then only the messages of that type should be returned, in the order
+        they were first added
+        """
+        messages = self.table.filter([MessageType.HEARTBEAT])
+        self.assertEqual([m.arb_id for m in messages], [0x701, 0x702])
+
+    def test_filter_supertype(self):
+        """Given a table with messages of different types
+        When filtering the table by a supertype
+        Then the messages of every type within the supertype should be
+        returned
+        """
+        messages = self.table.filter([MessageType.PDO])
+        self.assertEqual([m.arb_id for m in messages], [0x181])
+
+    def test_filter_after_add(self):
+        """Given a table that has already been filtered
+        When adding a message with a new COB ID and a message replacing an
+        existing COB ID
+        Then filtering again should include the new message and the latest
+        message of the existing COB ID
+        """
+        self.table.filter([MessageType.HEARTBEAT])
+        latest = Message(0x701, data=[0x04])
+        self.table += latest
+        self.table += Message(0x703, data=[0x05])
+
+        messages = self.table.filter([MessageType.HEARTBEAT])
+        self.assertEqual([m.arb_id for m in messages], [0x701, 0x702, 0x703])
+        self.assertIs(messages[0], latest)